@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
 import json
+import logging
+import mmap
 import os
+import sys
+import traceback
 
 from palworld_save_tools.gvas import GvasFile
 from palworld_save_tools.json_tools import CustomEncoder
@@ -13,13 +18,24 @@ from palworld_save_tools.paltypes import (
     PALWORLD_TYPE_HINTS,
 )
 
+logger = logging.getLogger(__name__)
+
+# Saves at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1024 * 1024
+# Files converted at once by default, each worker holds a whole parsed save
+DEFAULT_JOBS = 1
+
 
 def main():
     parser = argparse.ArgumentParser(
         prog="palworld-save-tools",
         description="Converts Palworld save files to and from JSON",
     )
-    parser.add_argument("filename")
+    parser.add_argument(
+        "filename",
+        nargs="+",
+        help="File(s) to convert, multiple files are converted concurrently",
+    )
     parser.add_argument(
         "--to-json",
         action="store_true",
@@ -60,40 +76,136 @@ def main():
         help="Comma-separated list of custom properties to decode, or 'all' for all known properties. This can be used to speed up processing by excluding properties that are not of interest. (default: all)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Files converted at once in separate processes (default: {DEFAULT_JOBS})",
+    )
+
     parser.add_argument("--minify-json", action="store_true", help="Minify JSON output")
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     if args.to_json and args.from_json:
         print("Cannot specify both --to-json and --from-json")
         exit(1)
 
-    if not os.path.exists(args.filename):
-        print(f"{args.filename} does not exist")
+    if args.output and len(args.filename) > 1:
+        print("Cannot specify --output with multiple files")
         exit(1)
-    if not os.path.isfile(args.filename):
-        print(f"{args.filename} is not a file")
+
+    if args.jobs < 1:
+        print("--jobs must be at least 1")
         exit(1)
 
-    if args.to_json or args.filename.endswith(".sav"):
-        if not args.output:
-            output_path = args.filename + ".json"
-        else:
-            output_path = args.output
+    for filename in args.filename:
+        if not os.path.exists(filename):
+            print(f"{filename} does not exist")
+            exit(1)
+        if not os.path.isfile(filename):
+            print(f"{filename} is not a file")
+            exit(1)
+
+    if len(args.filename) == 1:
+        convert_file(args.filename[0], args, force=args.force)
+    else:
+        convert_many(args.filename, args, max_workers=args.jobs)
+
+
+def output_paths(filename, args):
+    """
+    Returns the (JSON, SAV) output paths for a file, None where that
+    conversion does not apply.
+    """
+    json_path = None
+    sav_path = None
+    if args.to_json or filename.endswith(".sav"):
+        json_path = args.output or filename + ".json"
+    if args.from_json or filename.endswith(".json"):
+        sav_path = args.output or filename.replace(".json", "")
+    return json_path, sav_path
+
+
+def convert_file(filename, args, force=False):
+    json_path, sav_path = output_paths(filename, args)
+
+    if json_path:
         convert_sav_to_json(
-            args.filename,
-            output_path,
-            force=args.force,
+            filename,
+            json_path,
+            force=force,
             minify=args.minify_json,
             allow_nan=(not args.convert_nan_to_null),
             custom_properties_keys=args.custom_properties,
         )
 
-    if args.from_json or args.filename.endswith(".json"):
-        if not args.output:
-            output_path = args.filename.replace(".json", "")
-        else:
-            output_path = args.output
-        convert_json_to_sav(args.filename, output_path, force=args.force, zlib=(args.library == "zlib"))
+    if sav_path:
+        convert_json_to_sav(
+            filename, sav_path, force=force, zlib=(args.library == "zlib")
+        )
+
+
+def convert_many(filenames, args, max_workers=DEFAULT_JOBS):
+    """
+    Converts several files, in max_workers worker processes when more than
+    one is allowed. GVAS parsing and JSON encoding hold the GIL, so threads
+    would not overlap them. Every worker holds a whole parsed save, so
+    max_workers also bounds peak memory.
+    """
+    if not args.force:
+        # Ask once up front, workers must not prompt
+        existing = [
+            path
+            for filename in filenames
+            for path in output_paths(filename, args)
+            if path and os.path.exists(path)
+        ]
+        if existing:
+            print(
+                f"{len(existing)} output files already exist, this will overwrite them"
+            )
+            if not confirm_prompt("Are you sure you want to continue?"):
+                exit(1)
+
+    # A failing file does not stop the others, report them all at the end
+    failures = []
+    if max_workers == 1:
+        for filename in filenames:
+            try:
+                convert_file(filename, args, force=True)
+            except Exception as error:
+                failures.append((filename, error))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = {
+                executor.submit(_convert_file_in_worker, filename, args): filename
+                for filename in filenames
+            }
+        for future, filename in futures.items():
+            error = future.exception()
+            if error is not None:
+                failures.append((filename, error))
+
+    for filename, error in failures:
+        print(f"Failed to convert {filename}:")
+        traceback.print_exception(type(error), error, error.__traceback__)
+    if failures:
+        exit(1)
+
+
+def _convert_file_in_worker(filename, args):
+    # Workers share stdout, so tag every log line with the file it belongs to
+    logging.basicConfig(
+        level=logging.INFO,
+        format=filename.replace("%", "%%") + ": %(message)s",
+        stream=sys.stdout,
+        force=True,
+    )
+    convert_file(filename, args, force=True)
 
 
 def convert_sav_to_json(
@@ -104,17 +216,22 @@ def convert_sav_to_json(
     allow_nan=True,
     custom_properties_keys=["all"],
 ):
-    print(f"Converting {filename} to JSON, saving to {output_path}")
+    logger.info("Converting %s to JSON, saving to %s", filename, output_path)
     if os.path.exists(output_path):
-        print(f"{output_path} already exists, this will overwrite the file")
+        logger.info("%s already exists, this will overwrite the file", output_path)
         if not force:
             if not confirm_prompt("Are you sure you want to continue?"):
                 exit(1)
-    print(f"Decompressing sav file")
+    logger.info("Decompressing sav file")
     with open(filename, "rb") as f:
-        data = f.read()
+        data = read_sav_data(f)
+    try:
         raw_gvas, _ = decompress_sav_to_gvas(data)
-    print(f"Loading GVAS file")
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+        del data
+    logger.info("Loading GVAS file")
     custom_properties = {}
     if len(custom_properties_keys) > 0 and custom_properties_keys[0] == "all":
         custom_properties = PALWORLD_CUSTOM_PROPERTIES
@@ -125,7 +242,7 @@ def convert_sav_to_json(
     gvas_file = GvasFile.read(
         raw_gvas, PALWORLD_TYPE_HINTS, custom_properties, allow_nan=allow_nan
     )
-    print(f"Writing JSON to {output_path}")
+    logger.info("Writing JSON to %s", output_path)
     with open(output_path, "w", encoding="utf8") as f:
         indent = None if minify else "\t"
         json.dump(
@@ -134,17 +251,17 @@ def convert_sav_to_json(
 
 
 def convert_json_to_sav(filename, output_path, force=False, zlib=False):
-    print(f"Converting {filename} to SAV, saving to {output_path}")
+    logger.info("Converting %s to SAV, saving to %s", filename, output_path)
     if os.path.exists(output_path):
-        print(f"{output_path} already exists, this will overwrite the file")
+        logger.info("%s already exists, this will overwrite the file", output_path)
         if not force:
             if not confirm_prompt("Are you sure you want to continue?"):
                 exit(1)
-    print(f"Loading JSON from {filename}")
+    logger.info("Loading JSON from %s", filename)
     with open(filename, "r", encoding="utf8") as f:
         data = json.load(f)
     gvas_file = GvasFile.load(data)
-    print(f"Compressing SAV file")
+    logger.info("Compressing SAV file")
     if (
         "Pal.PalWorldSaveGame" in gvas_file.header.save_game_class_name
         or "Pal.PalLocalWorldSaveGame" in gvas_file.header.save_game_class_name
@@ -156,11 +273,22 @@ def convert_json_to_sav(filename, output_path, force=False, zlib=False):
     sav_file = compress_gvas_to_sav(
         gvas_file.write(PALWORLD_CUSTOM_PROPERTIES), save_type, zlib=zlib
     )
-    print(f"Writing SAV file to {output_path}")
+    logger.info("Writing SAV file to %s", output_path)
     with open(output_path, "wb") as f:
         f.write(sav_file)
 
 
+def read_sav_data(f):
+    """
+    Returns the contents of an open .sav file. Large files are memory-mapped
+    so the OS pages them in on demand instead of copying the whole file;
+    the caller must close() the returned mmap once it is done with it.
+    """
+    if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+        return f.read()
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def confirm_prompt(question: str) -> bool:
     reply = None
     while reply not in ("y", "n"):
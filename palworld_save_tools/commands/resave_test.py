@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 # This scripts takes a .sav file as input, and runs through the sav > JSON > sav process to ensure that the output is the same as the input.
+import logging
+import mmap
 import sys
 
 from palworld_save_tools.commands.convert import (
     convert_json_to_sav,
     convert_sav_to_json,
+    read_sav_data,
 )
 from palworld_save_tools.palsav import decompress_sav_to_gvas
 from palworld_save_tools.paltypes import DISABLED_PROPERTIES, PALWORLD_CUSTOM_PROPERTIES
@@ -15,6 +18,7 @@ def main():
         print(f"Usage: {sys.argv[0]} <input>")
         sys.exit(1)
     input_path = sys.argv[1]
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     print(f"Testing if {input_path} is the same after resaving...")
     output_json_path = input_path + ".resave.json"
     output_sav_path = input_path + ".resave.sav"
@@ -29,11 +33,19 @@ def main():
     convert_json_to_sav(output_json_path, output_sav_path)
     print(f"Comparing {input_path} and {output_sav_path}...")
     with open(input_path, "rb") as f:
-        input_bytes = f.read()
+        input_bytes = read_sav_data(f)
+    try:
         original_gvas, _ = decompress_sav_to_gvas(input_bytes)
+    finally:
+        if isinstance(input_bytes, mmap.mmap):
+            input_bytes.close()
     with open(output_sav_path, "rb") as f:
-        output_bytes = f.read()
+        output_bytes = read_sav_data(f)
+    try:
         resaved_gvas, _ = decompress_sav_to_gvas(output_bytes)
+    finally:
+        if isinstance(output_bytes, mmap.mmap):
+            output_bytes.close()
     if original_gvas == resaved_gvas:
         print("Files are the same!")
     else:
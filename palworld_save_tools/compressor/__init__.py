@@ -1,6 +1,12 @@
+import logging
 import struct
 
-from typing import Tuple
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# uncompressed length, compressed length, magic bytes + save type
+SAV_HEADER = struct.Struct("<III")
 
 class SaveType:
     PLM = 0x31  # Oodle compressed
@@ -17,6 +23,50 @@ class MagicBytes:
     @staticmethod
     def is_valid(magic: bytes) -> bool:
         return magic in (MagicBytes.PLZ, MagicBytes.PLM)
+
+# Magic bytes as integers, matching the low 3 bytes of the header's third word
+_MAGIC_PLZ = int.from_bytes(MagicBytes.PLZ, "little")
+_MAGIC_PLM = int.from_bytes(MagicBytes.PLM, "little")
+
+
+class SavHeader(NamedTuple):
+    format: int  # 1=PLM(Oodle), 0=PLZ(Zlib), -1=Unknown
+    uncompressed_len: int
+    compressed_len: int
+    magic: bytes
+    save_type: int
+    data_offset: int
+
+
+def probe_sav(sav_data: bytes) -> SavHeader:
+    """
+    Detect SAV file format and parse its header in a single pass.
+    Accepts any buffer (bytes, bytearray, memoryview, mmap).
+    """
+    # Determine header offset, the data follows the header
+    header_offset = 12 if sav_data[:3] == b"CNK" else 0
+    data_offset = header_offset + SAV_HEADER.size
+
+    if len(sav_data) < data_offset:
+        raise ValueError("File too small to parse header")
+
+    # Parse header fields, the magic is compared as an integer so no
+    # short-lived bytes objects are created
+    uncompressed_len, compressed_len, magic_and_type = (
+        SAV_HEADER.unpack_from(sav_data, header_offset)
+    )
+    magic_int = magic_and_type & 0xFFFFFF
+    save_type = magic_and_type >> 24
+
+    if magic_int == _MAGIC_PLM:
+        format, magic = 1, MagicBytes.PLM
+    elif magic_int == _MAGIC_PLZ:
+        format, magic = 0, MagicBytes.PLZ
+    else:
+        format, magic = -1, magic_int.to_bytes(3, "little")
+
+    return SavHeader(format, uncompressed_len, compressed_len, magic, save_type, data_offset)
+
     
 class Compressor():
     def __init__(self):
@@ -25,34 +75,6 @@ class Compressor():
         """
         pass
 
-    def _parse_sav_header(self, sav_data: bytes) -> Tuple[int, int, bytes, int, int]:
-        """
-        Parse SAV file header
-        Returns: (uncompressed length, compressed length, magic bytes, save type, data offset)
-        """
-        if len(sav_data) < 24:
-            raise ValueError("File too small to parse header")
-
-        # Determine header offset and data offset
-        if sav_data.startswith(b"CNK"):
-            header_offset = 12
-            data_offset = 24
-        else:
-            header_offset = 0
-            data_offset = 12
-
-        # Parse header fields
-        uncompressed_len = struct.unpack(
-            "<I", sav_data[header_offset : header_offset + 4]
-        )[0]
-        compressed_len = struct.unpack(
-            "<I", sav_data[header_offset + 4 : header_offset + 8]
-        )[0]
-        magic = sav_data[header_offset + 8 : header_offset + 11]
-        save_type = sav_data[header_offset + 11]
-
-        return uncompressed_len, compressed_len, magic, save_type, data_offset
-
     def _get_magic(self, save_type: int) -> bytes:
         if save_type == SaveType.PLZ:
             return b"PlZ"
@@ -67,29 +89,12 @@ class Compressor():
         else:
             return -1
         
-    def check_sav_format(self, sav_data: bytes) -> int:
-        """
-        Check SAV file format.
-        Returns: 1=PLM(Oodle), 0=PLZ(Zlib), -1=Unknown.
-        (This method is preserved)
-        """
-        if len(sav_data) < 12:
-            return -1
-        magic = sav_data[8:11]
-        print(f"Checking SAV format, magic bytes: {magic!r}")
-        if magic == MagicBytes.PLM:
-            return 1
-        elif magic == MagicBytes.PLZ:
-            return 0
-        else:
-            return -1
-        
     def build_sav(self, compressed_data: bytes, uncompressed_len: int, compressed_len: int, magic_bytes: bytes, save_type: int) -> bytes:
         """
         Build SAV file header.
         Returns: bytes with the header.
         """
-        print("Building .sav file...")
+        logger.info("Building .sav file...")
         result = bytearray()
         result.extend(uncompressed_len.to_bytes(4, "little"))
         result.extend(compressed_len.to_bytes(4, "little"))
@@ -97,5 +102,5 @@ class Compressor():
         result.extend(bytes([save_type]))
         result.extend(compressed_data)
 
-        print("Finished building .sav file.")
+        logger.info("Finished building .sav file.")
         return bytes(result)
\ No newline at end of file
@@ -1,12 +1,20 @@
+import functools
+import logging
 import os
 import sys
 import platform
 
+from typing import Optional
+
 from palworld_save_tools.compressor import (
     Compressor,
-    SaveType
+    SavHeader,
+    SaveType,
+    probe_sav
 )
 
+logger = logging.getLogger(__name__)
+
 class OodleCompressor:
     Kraken    = 8
     Mermaid   = 9
@@ -31,57 +39,60 @@ class OodleLevel:
     HyperFast4 = -4
 
 
+@functools.lru_cache(maxsize=None)
+def _import_ooz():
+    """
+    Load the Ooz library dynamically based on the platform.
+    This is done to ensure compatibility with different operating systems.
+    The module is resolved once and shared by every OozLib instance.
+    """
+    lib_path = ''
+
+    if sys.platform == 'win32':
+        lib_path = 'windows'
+    elif sys.platform == 'linux':
+        arch = platform.machine().lower()
+        if 'aarch64' in arch or 'arm' in arch:
+            lib_path = 'linux_arm64'
+        elif 'x86_64' in arch or 'amd64' in arch:
+            lib_path = 'linux_x86_64'
+        else:
+            raise Exception(f"Unsupported Linux architecture: {arch}")
+    elif sys.platform == 'darwin':
+        arch = platform.machine().lower()
+        if 'arm64' in arch:
+            lib_path = 'mac_arm64'
+        elif 'x86_64' in arch:
+            lib_path = 'mac_x86_64'
+        else:
+            raise Exception(f"Unsupported Mac architecture: {arch}")
+    else:
+        raise Exception(f"Unsupported platform: {sys.platform}")
+    
+    local_ooz_path = os.path.join(os.path.dirname(__file__), '..', 'lib', lib_path)
+    if os.path.isdir(local_ooz_path):
+        sys.path.insert(0, local_ooz_path)
+
+    try:
+        import ooz
+    except ImportError:
+        raise ImportError(
+            f"Failed to import 'ooz' module. Make sure the Ooz library exists in {local_ooz_path} or latest pyooz is installed in your Python environment. Install using 'pip install git+https://github.com/MRHRTZ/pyooz.git'"
+        )
+    
+    return ooz
+
+
 class OozLib(Compressor):
     def __init__(self):
         """
         OozLib is an open source library for compression and decompression using Oodle.
         """
         self.SAFE_SPACE_PADDING = 128
-        self.__load_ooz()
-        
-    def __load_ooz(self):
-        """
-        Load the Ooz library dynamically based on the platform.
-        This is done to ensure compatibility with different operating systems.
-        """
-        lib_path = ''
-
-        if sys.platform == 'win32':
-            lib_path = 'windows'
-        elif sys.platform == 'linux':
-            arch = platform.machine().lower()
-            if 'aarch64' in arch or 'arm' in arch:
-                lib_path = 'linux_arm64'
-            elif 'x86_64' in arch or 'amd64' in arch:
-                lib_path = 'linux_x86_64'
-            else:
-                raise Exception(f"Unsupported Linux architecture: {arch}")
-        elif sys.platform == 'darwin':
-            arch = platform.machine().lower()
-            if 'arm64' in arch:
-                lib_path = 'mac_arm64'
-            elif 'x86_64' in arch:
-                lib_path = 'mac_x86_64'
-            else:
-                raise Exception(f"Unsupported Mac architecture: {arch}")
-        else:
-            raise Exception(f"Unsupported platform: {sys.platform}")
-        
-        local_ooz_path = os.path.join(os.path.dirname(__file__), '..', 'lib', lib_path)
-        if os.path.isdir(local_ooz_path):
-            sys.path.insert(0, local_ooz_path)
-
-        try:
-            import ooz
-        except ImportError:
-            raise ImportError(
-                f"Failed to import 'ooz' module. Make sure the Ooz library exists in {local_ooz_path} or latest pyooz is installed in your Python environment. Install using 'pip install git+https://github.com/MRHRTZ/pyooz.git'"
-            )
-        
-        self.ooz = ooz
+        self.ooz = _import_ooz()
         
     def compress(self, data: bytes, save_type: int) -> bytes:
-        print("\nStarting compression process with libooz...")
+        logger.info("Starting compression process with libooz...")
 
         uncompressed_len = len(data)
         if uncompressed_len == 0:
@@ -92,7 +103,7 @@ class OozLib(Compressor):
                 f"Unhandled compression type: 0x{save_type:02X}, only 0x31 (PLM) is supported"
             )
             
-        print("Compressing data...")
+        logger.info("Compressing data...")
         
         compressed_data = self.ooz.compress(
             OodleCompressor.Kraken, 
@@ -107,14 +118,15 @@ class OozLib(Compressor):
         compressed_len = len(compressed_data)
         magic_bytes = self._get_magic(save_type)
             
-        print(f"Compression successful, compressed size: {compressed_len:,} bytes")
-
-        print(f"File information (Compress):")
-        print(f"  Magic bytes: {magic_bytes.decode('ascii', errors='ignore')}")
-        print(f"  Save type: 0x{save_type:02X}")
-        print(f"  Compressed size: {compressed_len:,} bytes")
-        print(f"  Uncompressed size: {uncompressed_len:,} bytes")
-        print(f"  Hex dump: {compressed_data.hex()[:64]}")
+        logger.info("Compression successful, compressed size: %d bytes", compressed_len)
+
+        logger.info("File information (Compress):")
+        logger.info("  Magic bytes: %s", magic_bytes.decode('ascii', errors='ignore'))
+        logger.info("  Save type: 0x%02X", save_type)
+        logger.info("  Compressed size: %d bytes", compressed_len)
+        logger.info("  Uncompressed size: %d bytes", uncompressed_len)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Hex dump: %s", memoryview(compressed_data)[:32].hex())
         
         sav_data = self.build_sav(
             compressed_data,
@@ -126,13 +138,17 @@ class OozLib(Compressor):
         
         return sav_data
 
-    def decompress(self, data: bytes) -> bytes:
-        print("\nStarting decompression process with libooz...")
+    def decompress(
+        self, data: bytes, header: Optional[SavHeader] = None
+    ) -> tuple[bytes, int]:
+        logger.info("Starting decompression process with libooz...")
         
         if not data:
             raise ValueError("SAV data cannot be empty")
 
-        format_result = self.check_sav_format(data)
+        if header is None:
+            header = probe_sav(data)
+        format_result, uncompressed_len, compressed_len, magic, save_type, data_offset = header
         if format_result == 0:
             raise ValueError(
                 "Detected PLZ format (Zlib), this tool only supports PLM format (Oodle)"
@@ -141,18 +157,16 @@ class OozLib(Compressor):
             raise ValueError("Unknown SAV file format")
 
         
-        uncompressed_len, compressed_len, magic, save_type, data_offset = (
-            self._parse_sav_header(data)
-        )
-        
-        print(f"File information (Decompress):")
-        print(f"  Magic bytes: {magic.decode('ascii', errors='ignore')}")
-        print(f"  Save type: 0x{save_type:02X}")
-        print(f"  Compressed size: {compressed_len:,} bytes")
-        print(f"  Uncompressed size: {uncompressed_len:,} bytes")
-        print(f"  Data offset: {data_offset} bytes")
-        print("Detected PLM format (Oodle), starting decompression...")
-    
+        logger.info("File information (Decompress):")
+        logger.info("  Magic bytes: %s", magic.decode('ascii', errors='ignore'))
+        logger.info("  Save type: 0x%02X", save_type)
+        logger.info("  Compressed size: %d bytes", compressed_len)
+        logger.info("  Uncompressed size: %d bytes", uncompressed_len)
+        logger.info("  Data offset: %d bytes", data_offset)
+        logger.info("Detected PLM format (Oodle), starting decompression...")
+
+        # A real slice, not a memoryview: pyooz parses its input as "y#",
+        # which only accepts bytes
         compressed_data = data[data_offset : data_offset + compressed_len]
         decompressed = self.ooz.decompress(compressed_data, uncompressed_len)
         
@@ -161,7 +175,7 @@ class OozLib(Compressor):
                 f"Decompressed data length {len(decompressed)} does not match expected uncompressed length {uncompressed_len}"
             )
             
-        print(f"Decompression successful, decompressed size: {len(decompressed):,} bytes")
+        logger.info("Decompression successful, decompressed size: %d bytes", len(decompressed))
         
         return decompressed, save_type
 
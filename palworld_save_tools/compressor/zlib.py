@@ -1,10 +1,21 @@
+import io
+import logging
 import zlib
 
+from typing import Optional
+
 from palworld_save_tools.compressor import (
     Compressor,
-    SaveType
+    SavHeader,
+    SaveType,
+    probe_sav
 )
 
+logger = logging.getLogger(__name__)
+
+ZLIB_LEVEL = 6  # zlib's default level, spelled out
+ZLIB_CHUNK_SIZE = 64 * 1024  # input fed to a zlib stream per step
+
 class Zlib(Compressor):
     def __init__(self):
         """
@@ -13,24 +24,38 @@ class Zlib(Compressor):
         self.SAFE_SPACE_PADDING = 128
         
     def compress(self, data: bytes, save_type: int) -> bytes:
-        print("\nStarting compression process with zlib...")
+        logger.info("Starting compression process with zlib...")
         
-        uncompressed_len = len(data)
-        compressed_data = zlib.compress(data)
-        compressed_len = len(compressed_data)
-        if save_type != 0x32:
+        if save_type != SaveType.PLZ:
             raise Exception(
                 f"Unhandled compression type: 0x{save_type:02X}, only 0x32 (double zlib) is supported"
             )
-        compressed_data = zlib.compress(compressed_data)
+
+        uncompressed_len = len(data)
+        # The inner stream is fed straight into the outer one, so it is never
+        # held in memory as a whole. The header stores its length.
+        inner = zlib.compressobj(ZLIB_LEVEL)
+        outer = zlib.compressobj(ZLIB_LEVEL)
+        compressed_data = bytearray()
+        compressed_len = 0
+        view = memoryview(data)
+        for offset in range(0, uncompressed_len, ZLIB_CHUNK_SIZE):
+            part = inner.compress(view[offset : offset + ZLIB_CHUNK_SIZE])
+            compressed_len += len(part)
+            compressed_data += outer.compress(part)
+        part = inner.flush()
+        compressed_len += len(part)
+        compressed_data += outer.compress(part)
+        compressed_data += outer.flush()
         magic_bytes = self._get_magic(save_type)
         
-        print(f"File information (Compress):")
-        print(f"  Magic bytes: {magic_bytes.decode('ascii', errors='ignore')}")
-        print(f"  Save type: 0x{save_type:02X}")
-        print(f"  Compressed size: {compressed_len:,} bytes")
-        print(f"  Uncompressed size: {uncompressed_len:,} bytes")
-        print(f"  Hex dump: {compressed_data.hex()[:64]}")
+        logger.info("File information (Compress):")
+        logger.info("  Magic bytes: %s", magic_bytes.decode('ascii', errors='ignore'))
+        logger.info("  Save type: 0x%02X", save_type)
+        logger.info("  Compressed size: %d bytes", compressed_len)
+        logger.info("  Uncompressed size: %d bytes", uncompressed_len)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Hex dump: %s", memoryview(compressed_data)[:32].hex())
         
         
         sav_data = self.build_sav(        
@@ -43,10 +68,14 @@ class Zlib(Compressor):
 
         return sav_data
 
-    def decompress(self, data: bytes) -> bytes:
-        print("\nStarting decompression process with zlib...")
+    def decompress(
+        self, data: bytes, header: Optional[SavHeader] = None
+    ) -> tuple[bytes, int]:
+        logger.info("Starting decompression process with zlib...")
         
-        format_result = self.check_sav_format(data)
+        if header is None:
+            header = probe_sav(data)
+        format_result, uncompressed_len, compressed_len, magic, save_type, data_offset = header
         if format_result == 1:
             raise ValueError(
                 "Detected PLM format (Oodle), this tool only supports PLZ format (Zlib)"
@@ -55,28 +84,48 @@ class Zlib(Compressor):
             raise ValueError("Unknown SAV file format")
 
         
-        uncompressed_len, compressed_len, magic, save_type, data_offset = (
-            self._parse_sav_header(data)
-        )
-        
-        print(f"File information (Decompress):")
-        print(f"  Magic bytes: {magic.decode('ascii', errors='ignore')}")
-        print(f"  Save type: 0x{save_type:02X}")
-        print(f"  Compressed size: {compressed_len:,} bytes")
-        print(f"  Uncompressed size: {uncompressed_len:,} bytes")
-        print("Detected PLZ format (Zlib), starting decompression...")
-        
-        uncompressed_data = zlib.decompress(data[data_offset:])
+        logger.info("File information (Decompress):")
+        logger.info("  Magic bytes: %s", magic.decode('ascii', errors='ignore'))
+        logger.info("  Save type: 0x%02X", save_type)
+        logger.info("  Compressed size: %d bytes", compressed_len)
+        logger.info("  Uncompressed size: %d bytes", uncompressed_len)
+        logger.info("Detected PLZ format (Zlib), starting decompression...")
         
-        if save_type == SaveType.PLZ:
-            if compressed_len != len(uncompressed_data):
+        # Inflate in chunks; for double zlib the outer output is fed straight
+        # into the inner stream so the intermediate data is never held whole
+        outer = zlib.decompressobj()
+        inner = zlib.decompressobj() if save_type == SaveType.PLZ else None
+        # Pieces are appended to one buffer rather than collected and joined,
+        # which would briefly hold the output twice. BytesIO.getvalue() hands
+        # over its buffer as bytes without another copy.
+        output = io.BytesIO()
+        inner_len = 0
+        # Release the view even on error, or an mmap'd input cannot be closed
+        with memoryview(data)[data_offset:] as view:
+            for offset in range(0, len(view), ZLIB_CHUNK_SIZE):
+                part = outer.decompress(view[offset : offset + ZLIB_CHUNK_SIZE])
+                if inner is not None:
+                    inner_len += len(part)
+                    part = inner.decompress(part)
+                output.write(part)
+                if outer.eof:
+                    break
+        if not outer.eof:
+            raise Exception("incomplete or truncated zlib stream")
+
+        if inner is not None:
+            if compressed_len != inner_len:
                 raise Exception(f"incorrect compressed length: {compressed_len}")
-            
-            uncompressed_data = zlib.decompress(uncompressed_data)
-            
+            output.write(inner.flush())
+            if not inner.eof:
+                raise Exception("incomplete or truncated inner zlib stream")
+
+        uncompressed_data = output.getvalue()
+        del output
+
         if uncompressed_len != len(uncompressed_data):
             raise Exception(f"incorrect uncompressed length: {uncompressed_len}")
 
-        print(f"Decompression successful, decompressed size: {len(uncompressed_data):,} bytes")
+        logger.info("Decompression successful, decompressed size: %d bytes", len(uncompressed_data))
 
         return uncompressed_data, save_type
\ No newline at end of file
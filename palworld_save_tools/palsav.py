@@ -1,20 +1,27 @@
-from palworld_save_tools.compressor import Compressor
+import functools
+
+from palworld_save_tools.compressor import Compressor, probe_sav
 from palworld_save_tools.compressor.oozlib import OozLib
 from palworld_save_tools.compressor.zlib import Zlib
 
 compressor = Compressor()
-oozlib = OozLib()
 z_lib = Zlib()
 
+
+@functools.lru_cache(maxsize=None)
+def _get_oozlib() -> OozLib:
+    # Created on first use so zlib-only workflows never load libooz
+    return OozLib()
+
         
 def decompress_sav_to_gvas(data: bytes, zlib: bool = False) -> tuple[bytes, int]:
-    format = compressor.check_sav_format(data)
+    header = probe_sav(data)
     
-    if format == 0:
-        return z_lib.decompress(data)
-    elif format == 1:
-        return oozlib.decompress(data)
-    elif format == -1:
+    if header.format == 0:
+        return z_lib.decompress(data, header)
+    elif header.format == 1:
+        return _get_oozlib().decompress(data, header)
+    elif header.format == -1:
         raise Exception("Unknown save format")
 
 def compress_gvas_to_sav(data: bytes, save_type: int, zlib: bool = False) -> bytes:
@@ -27,6 +34,6 @@ def compress_gvas_to_sav(data: bytes, save_type: int, zlib: bool = False) -> byt
         if format == 0:
             return z_lib.compress(data, save_type)
         elif format == 1:
-            return oozlib.compress(data, save_type)
+            return _get_oozlib().compress(data, save_type)
         elif format == -1:
             raise Exception("Unknown save type format")
@@ -1,10 +1,21 @@
 import contextlib
+import mmap
 import os
+import shutil
 import subprocess
+import tempfile
 import unittest
 
 from parameterized import parameterized
 
+from palworld_save_tools.commands.convert import (
+    MMAP_THRESHOLD,
+    convert_sav_to_json,
+    read_sav_data,
+)
+from palworld_save_tools.compressor import SaveType, probe_sav
+from palworld_save_tools.palsav import decompress_sav_to_gvas
+
 
 class TestCliScripts(unittest.TestCase):
     @parameterized.expand(
@@ -115,3 +126,157 @@ class TestCliScripts(unittest.TestCase):
                 os.remove(f"tests/testdata/{dir_name}/3-{base_name}")
             with contextlib.suppress(FileNotFoundError):
                 os.remove(f"tests/testdata/{dir_name}/3-{base_name}.json")
+
+    def _copy_saves(self, tmp_dir, file_names):
+        paths = []
+        for file_name in file_names:
+            path = os.path.join(tmp_dir, file_name)
+            shutil.copy(f"tests/testdata/{file_name}", path)
+            paths.append(path)
+        return paths
+
+    def test_convert_many(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = self._copy_saves(tmp_dir, ["LevelMeta.sav", "WorldOption.sav"])
+            run = subprocess.run(
+                ["python3", "-m", "palworld_save_tools.commands.convert", *paths]
+            )
+            self.assertEqual(run.returncode, 0)
+            for path in paths:
+                self.assertTrue(os.path.exists(f"{path}.json"))
+
+    def test_convert_many_prompts_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = self._copy_saves(tmp_dir, ["LevelMeta.sav", "WorldOption.sav"])
+            for path in paths:
+                with open(f"{path}.json", "w") as f:
+                    f.write("{}")
+            run = subprocess.run(
+                ["python3", "-m", "palworld_save_tools.commands.convert", *paths],
+                input="n\n",
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(run.returncode, 1)
+            self.assertEqual(run.stdout.count("Are you sure"), 1)
+            self.assertIn("2 output files already exist", run.stdout)
+            for path in paths:
+                with open(f"{path}.json") as f:
+                    self.assertEqual(f.read(), "{}")
+
+    def test_convert_many_in_workers(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = self._copy_saves(tmp_dir, ["LevelMeta.sav", "WorldOption.sav"])
+            run = subprocess.run(
+                [
+                    "python3",
+                    "-m",
+                    "palworld_save_tools.commands.convert",
+                    "--jobs",
+                    "2",
+                    *paths,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(run.returncode, 0)
+            lines = run.stdout.splitlines()
+            for path in paths:
+                self.assertTrue(os.path.exists(f"{path}.json"))
+                self.assertIn(f"{path}: Decompressing sav file", lines)
+            # Every worker line names the file it belongs to
+            for line in lines:
+                self.assertTrue(line.startswith(tuple(f"{p}: " for p in paths)))
+
+    @parameterized.expand([("1"), ("2")])
+    def test_convert_many_reports_failures(self, jobs):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = self._copy_saves(tmp_dir, ["LevelMeta.sav"])
+            broken_path = os.path.join(tmp_dir, "Broken.sav")
+            with open(broken_path, "wb") as f:
+                f.write(b"\x00" * 8)
+            run = subprocess.run(
+                [
+                    "python3",
+                    "-m",
+                    "palworld_save_tools.commands.convert",
+                    "--jobs",
+                    jobs,
+                    broken_path,
+                    *paths,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(run.returncode, 1)
+            self.assertIn(f"Failed to convert {broken_path}", run.stdout)
+            self.assertIn("Traceback", run.stderr)
+            self.assertIn("File too small to parse header", run.stderr)
+            self.assertTrue(os.path.exists(f"{paths[0]}.json"))
+
+    def test_convert_many_rejects_output(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = self._copy_saves(tmp_dir, ["LevelMeta.sav", "WorldOption.sav"])
+            output_path = os.path.join(tmp_dir, "out.json")
+            run = subprocess.run(
+                [
+                    "python3",
+                    "-m",
+                    "palworld_save_tools.commands.convert",
+                    "--output",
+                    output_path,
+                    *paths,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(run.returncode, 1)
+            self.assertIn("Cannot specify --output with multiple files", run.stdout)
+            self.assertFalse(os.path.exists(output_path))
+
+    def test_read_sav_data_mmap(self):
+        with open("tests/testdata/larger-saves/Level.sav", "rb") as f:
+            data = read_sav_data(f)
+        self.assertIsInstance(data, mmap.mmap)
+        self.assertGreater(len(data), MMAP_THRESHOLD)
+        try:
+            gvas, save_type = decompress_sav_to_gvas(data)
+            self.assertEqual(probe_sav(data).uncompressed_len, len(gvas))
+            self.assertEqual(SaveType.PLZ, save_type)
+        finally:
+            data.close()
+        self.assertTrue(data.closed)
+
+    def test_convert_truncated_mmap_save(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "Level.sav")
+            with open("tests/testdata/larger-saves/Level.sav", "rb") as f:
+                data = f.read()
+            with open(path, "wb") as f:
+                f.write(data[: len(data) // 2])
+            self.assertGreater(os.path.getsize(path), MMAP_THRESHOLD)
+            # The zlib error must surface, not a BufferError from closing the map
+            with self.assertRaisesRegex(
+                Exception, "incomplete or truncated zlib stream"
+            ):
+                convert_sav_to_json(path, f"{path}.json", force=True)
+
+    def test_convert_progress_on_stdout(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            (path,) = self._copy_saves(tmp_dir, ["LevelMeta.sav"])
+            run = subprocess.run(
+                ["python3", "-m", "palworld_save_tools.commands.convert", path],
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(run.returncode, 0)
+            # Compressor logging and convert's own messages share stdout, in order
+            lines = run.stdout.splitlines()
+            self.assertLess(
+                lines.index("Decompressing sav file"),
+                lines.index("Starting decompression process with zlib..."),
+            )
+            self.assertLess(
+                lines.index("Starting decompression process with zlib..."),
+                lines.index("Loading GVAS file"),
+            )
@@ -0,0 +1,51 @@
+import unittest
+
+from parameterized import parameterized
+
+from palworld_save_tools.compressor import SaveType, probe_sav
+from palworld_save_tools.compressor.zlib import Zlib
+
+
+class TestCompressor(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("Level.sav"),
+            ("LevelMeta.sav"),
+        ]
+    )
+    def test_probe_sav_honours_cnk_prefix(self, file_name):
+        with open(f"tests/testdata/{file_name}", "rb") as f:
+            data = f.read()
+        header = probe_sav(data)
+        cnk_header = probe_sav(b"CNK" + b"\x00" * 9 + data)
+        self.assertEqual(0, header.format)
+        self.assertEqual(12, header.data_offset)
+        self.assertEqual(24, cnk_header.data_offset)
+        self.assertEqual(header[:5], cnk_header[:5])
+
+    def test_probe_sav_unknown_magic(self):
+        header = probe_sav(b"\x01" * 24)
+        self.assertEqual(-1, header.format)
+        self.assertEqual(b"\x01\x01\x01", header.magic)
+
+    def test_probe_sav_too_small(self):
+        with self.assertRaises(ValueError):
+            probe_sav(b"CNK" + b"\x00" * 12)
+
+    def test_zlib_roundtrip(self):
+        data = bytes(range(256)) * 1024
+        z_lib = Zlib()
+        sav = z_lib.compress(data, SaveType.PLZ)
+        header = probe_sav(sav)
+        self.assertEqual(SaveType.PLZ, header.save_type)
+        self.assertEqual(len(data), header.uncompressed_len)
+        gvas, save_type = z_lib.decompress(sav, header)
+        self.assertIsInstance(gvas, bytes)
+        self.assertEqual(data, gvas)
+        self.assertEqual(SaveType.PLZ, save_type)
+
+    def test_zlib_decompress_truncated(self):
+        with open("tests/testdata/Level.sav", "rb") as f:
+            data = f.read()
+        with self.assertRaisesRegex(Exception, "incomplete or truncated"):
+            Zlib().decompress(data[: len(data) // 2])